@@ -11,6 +11,7 @@ import bpy
 from bpy.props import (
         StringProperty,
         BoolProperty,
+        IntProperty,
     )
 from bpy_extras.io_utils import (
         ImportHelper,
@@ -42,6 +43,22 @@ class ImportMistuba(bpy.types.Operator, ImportHelper):
         default = True,
     )
 
+    sphere_u_segments: IntProperty(
+        name = 'Sphere U Segments',
+        description = 'Number of segments around the meshes created for Mitsuba spheres. '
+                      'Mitsuba spheres are analytic, this only affects their Blender representation.',
+        default = 32,
+        min = 3,
+    )
+
+    sphere_v_segments: IntProperty(
+        name = 'Sphere V Segments',
+        description = 'Number of rings of the meshes created for Mitsuba spheres. '
+                      'Mitsuba spheres are analytic, this only affects their Blender representation.',
+        default = 16,
+        min = 3,
+    )
+
     def execute(self, context):
         # Set blender to object mode
         if bpy.ops.object.mode_set.poll():
@@ -63,7 +80,9 @@ class ImportMistuba(bpy.types.Operator, ImportHelper):
         collection = scene.collection
 
         try:
-            importer.load_mitsuba_scene(context, scene, collection, self.filepath, axis_mat)
+            importer.load_mitsuba_scene(context, scene, collection, self.filepath, axis_mat,
+                                        sphere_u_segments=self.sphere_u_segments,
+                                        sphere_v_segments=self.sphere_v_segments)
         except (RuntimeError, NotImplementedError) as e:
             print(e)
             self.report({'ERROR'}, "Failed to load Mitsuba scene. See error log.")
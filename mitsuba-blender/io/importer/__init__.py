@@ -1,4 +1,6 @@
 import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 if "bpy" in locals():
     import importlib
@@ -364,7 +366,7 @@ def instantiate_bl_data_node(mi_context, bl_node):
 ##    Main loading     ##
 #########################
 
-def load_mitsuba_scene(bl_context, bl_scene, bl_collection, filepath, global_mat):
+def load_mitsuba_scene(bl_context, bl_scene, bl_collection, filepath, global_mat, sphere_u_segments=32, sphere_v_segments=16):
     ''' Load a Mitsuba scene from an XML file into a Blender scene.
     
     Params
@@ -374,16 +376,30 @@ def load_mitsuba_scene(bl_context, bl_scene, bl_collection, filepath, global_mat
     bl_collection: Blender collection
     filepath: Path to the Mitsuba XML scene file
     global_mat: Axis conversion matrix
+    sphere_u_segments: Number of segments around the Blender meshes of spheres
+    sphere_v_segments: Number of rings of the Blender meshes of spheres
     '''
     start_time = time.time()
     # Load the Mitsuba XML and extract the objects' properties
-    from mitsuba import xml_to_props
+    from mitsuba import xml_to_props, variant
     raw_props = xml_to_props(filepath)
     mi_scene_props = common.MitsubaSceneProperties(raw_props)
-    mi_context = common.MitsubaSceneImportContext(bl_context, bl_scene, bl_collection, filepath, mi_scene_props, global_mat)
+    mi_context = common.MitsubaSceneImportContext(bl_context, bl_scene, bl_collection, filepath, mi_scene_props, global_mat,
+                                                  sphere_u_segments=sphere_u_segments, sphere_v_segments=sphere_v_segments)
 
     _, mi_props = mi_scene_props.get_first_of_class('Scene')
-    bl_scene_data_node = mi_props_to_bl_data_node(mi_context, 'Scene', mi_props)
+    # Load the heavy mesh data in parallel while the scene graph is being converted
+    worker_count = max(1, (os.cpu_count() or 2) - 1)
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        prefetcher = shapes.MitsubaShapeDataPrefetcher(executor, bl_scene.thread_env, variant(), max_pending=worker_count)
+        mi_context.mi_shape_data_prefetcher = prefetcher
+        try:
+            shapes.prefetch_mi_shape_data(mi_context, prefetcher)
+            bl_scene_data_node = mi_props_to_bl_data_node(mi_context, 'Scene', mi_props)
+        finally:
+            # Cancel any prefetched data that was not consumed by a converter
+            prefetcher.shutdown()
+            mi_context.mi_shape_data_prefetcher = None
     if bl_scene_data_node is None:
         mi_context.log('Failed to load Mitsuba scene', 'ERROR')
         return
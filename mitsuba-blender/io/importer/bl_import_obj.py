@@ -388,12 +388,15 @@ def load(filepath,
          use_split_objects=True,
          use_split_groups=False,
          use_groups_as_vgroups=False,
+         single_mesh=False,
          ):
     """
     Called by the user interface or another script.
     load_obj(path) - should give acceptable results.
     This function passes the file and sends the data off
         to be split into objects and then converted into mesh objects
+    If single_mesh is set, all objects and groups are merged into one mesh
+        so that no unused meshes are created.
     """
     def unique_name(existing_names, name_orig):
         i = 0
@@ -429,6 +432,10 @@ def load(filepath,
             [],  # If non-empty, that face is a Blender-invalid ngon (holes...), need a mutable object for that...
         )
 
+    if single_mesh:
+        use_split_objects = False
+        use_split_groups = False
+
     if use_split_objects or use_split_groups:
         use_groups_as_vgroups = False
 
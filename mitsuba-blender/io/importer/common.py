@@ -2,6 +2,8 @@ from enum import Enum
 from collections import OrderedDict
 import os
 
+import numpy as np
+
 class BlenderNodeType(Enum):
     NONE = 0,
     SCENE = 1,
@@ -201,7 +203,7 @@ class MitsubaSceneProperties:
 
 class MitsubaSceneImportContext:
     ''' Define a context for the Mitsuba scene importer '''
-    def __init__(self, bl_context, bl_scene, bl_collection, filepath, mi_scene_props, axis_matrix):
+    def __init__(self, bl_context, bl_scene, bl_collection, filepath, mi_scene_props, axis_matrix, sphere_u_segments=32, sphere_v_segments=16):
         self.bl_context = bl_context
         self.bl_scene = bl_scene
         self.bl_collection = bl_collection
@@ -210,8 +212,14 @@ class MitsubaSceneImportContext:
         self.mi_scene_props = mi_scene_props
         self.axis_matrix = axis_matrix
         self.axis_matrix_inv = axis_matrix.inverted()
+        self.axis_matrix_inv_np = np.array(self.axis_matrix_inv)
+        self.sphere_u_segments = sphere_u_segments
+        self.sphere_v_segments = sphere_v_segments
         self.bl_material_cache = {}
         self.bl_image_cache = {}
+        self.bl_primitive_mesh_cache = {}
+        self.bl_world_matrix_cache = {}
+        self.mi_shape_data_prefetcher = None
 
     def log(self, message, level='INFO'):
         '''
@@ -241,6 +249,10 @@ class MitsubaSceneImportContext:
     def mi_space_to_bl_space(self, matrix):
         return self.axis_matrix_inv @ matrix
 
+    def mi_space_to_bl_space_np(self, point):
+        ''' Transform a 3D point from Mitsuba space to Blender space as a numpy array '''
+        return self.axis_matrix_inv_np[:3, :3] @ np.asarray(point) + self.axis_matrix_inv_np[:3, 3]
+
     def resolve_scene_relative_path(self, path):
         abs_path = os.path.join(self.directory, path)
         if not os.path.exists(abs_path):
@@ -265,3 +277,21 @@ class MitsubaSceneImportContext:
         if id not in self.bl_image_cache:
             return None
         return self.bl_image_cache[id]
+
+    def register_bl_primitive_mesh(self, key, bl_mesh):
+        if key not in self.bl_primitive_mesh_cache:
+            self.bl_primitive_mesh_cache[key] = bl_mesh
+
+    def get_bl_primitive_mesh(self, key):
+        if key not in self.bl_primitive_mesh_cache:
+            return None
+        return self.bl_primitive_mesh_cache[key]
+
+    def register_bl_world_matrix(self, key, world_matrix):
+        if key not in self.bl_world_matrix_cache:
+            self.bl_world_matrix_cache[key] = world_matrix
+
+    def get_bl_world_matrix(self, key):
+        if key not in self.bl_world_matrix_cache:
+            return None
+        return self.bl_world_matrix_cache[key]
@@ -1,4 +1,5 @@
 import time
+from collections import OrderedDict
 
 if "bpy" in locals():
     import importlib
@@ -11,7 +12,7 @@ if "bpy" in locals():
 
 import bpy
 import bmesh
-from mathutils import Matrix, Vector
+from mathutils import Matrix
 import numpy as np
 
 from . import bl_transform_utils
@@ -22,7 +23,24 @@ from . import bl_import_obj
 ##    Utilities     ##
 ######################
 
-def _set_bl_mesh_shading(bl_mesh, flat_shading=True, flip_normals=False):
+def _foreach_set(bl_collection, attr, data, dtype):
+    ''' Write a numpy buffer into a Blender collection attribute.
+    Blender only uses its fast memory copy path if the buffer is contiguous and
+    matches the attribute's internal type, otherwise it silently falls back to
+    converting every element. The check is skipped when Python runs optimized.
+
+    Params
+    ------
+    bl_collection : The Blender collection to write to.
+    attr : Name of the attribute to set.
+    data : Flat numpy buffer holding the attribute values.
+    dtype : Expected numpy type of the buffer.
+    '''
+    assert data.dtype == dtype and data.flags['C_CONTIGUOUS'], \
+        f'Buffer for "{attr}" must be a contiguous {np.dtype(dtype).name} array, got {data.dtype.name}.'
+    bl_collection.foreach_set(attr, data)
+
+def _set_bl_mesh_shading(bl_mesh, flat_shading=True, flip_normals=False, is_new_mesh=False, update=True):
     ''' Set a Blender mesh shading mode.
 
     Params
@@ -32,15 +50,42 @@ def _set_bl_mesh_shading(bl_mesh, flat_shading=True, flip_normals=False):
         Should the face normals be used instead of the vertex normals?
     flip_normals : boolean, optional
         Should the normals be flipped from the current normal direction?
+    is_new_mesh : boolean, optional
+        Was the mesh just created without touching its shading? Newly created
+        polygons are already flat shaded so no write is needed in that case.
+    update : boolean, optional
+        Should the mesh be updated afterwards? Callers that update the mesh
+        themselves can skip it to avoid a second update.
     '''
     if flat_shading:
-        bl_mesh.polygons.foreach_set('use_smooth', [False] * len(bl_mesh.polygons))
+        if not is_new_mesh:
+            _foreach_set(bl_mesh.polygons, 'use_smooth', np.zeros(len(bl_mesh.polygons), dtype=np.bool_), np.bool_)
     else:
-        bl_mesh.calc_normals()
-        bl_mesh.polygons.foreach_set('use_smooth', [True] * len(bl_mesh.polygons))
+        _foreach_set(bl_mesh.polygons, 'use_smooth', np.ones(len(bl_mesh.polygons), dtype=np.bool_), np.bool_)
     if flip_normals:
         bl_mesh.flip_normals()
-    bl_mesh.update()
+    if update:
+        bl_mesh.update()
+
+def _mi_to_world_to_bl_world_matrix(mi_context, mi_shape):
+    ''' Convert the `to_world` transform of a Mitsuba shape to a Blender world matrix.
+    Scenes often reuse the same few transforms, so the converted matrices are cached
+    in the import context, keyed by the raw Mitsuba matrix.
+
+    Params
+    ------
+    mi_context : The Mitsuba import context.
+    mi_shape : The Mitsuba shape properties.
+    '''
+    mi_transform = mi_shape.get('to_world', None)
+    key = mi_transform.matrix.numpy().tobytes() if mi_transform is not None else None
+    world_matrix = mi_context.get_bl_world_matrix(key)
+    if world_matrix is None:
+        world_matrix = mi_context.mi_space_to_bl_space(bl_transform_utils.mi_transform_to_bl_transform(mi_transform))
+        # NOTE: The matrix is shared between shapes, make sure it is never modified in place
+        world_matrix.freeze()
+        mi_context.register_bl_world_matrix(key, world_matrix)
+    return world_matrix
 
 ######################
 ##    Converters    ##
@@ -58,12 +103,12 @@ def mi_ply_to_bl_shape(mi_context, mi_shape):
         mi_context.log(f'Cannot load PLY mesh file "{filename}".', 'ERROR')
         return None
     
-    # Set face normals if requested
-    _set_bl_mesh_shading(bl_mesh, mi_shape.get('face_normals', False))
+    # Set face normals and flip them if requested
+    _set_bl_mesh_shading(bl_mesh, mi_shape.get('face_normals', False), flip_normals=mi_shape.get('flip_normals', False))
 
-    world_matrix = bl_transform_utils.mi_transform_to_bl_transform(mi_shape.get('to_world', None))
+    world_matrix = _mi_to_world_to_bl_world_matrix(mi_context, mi_shape)
 
-    return bl_mesh, mi_context.mi_space_to_bl_space(world_matrix)
+    return bl_mesh, world_matrix
 
 def mi_obj_to_bl_shape(mi_context, mi_shape):
     start_time = time.time()
@@ -74,137 +119,290 @@ def mi_obj_to_bl_shape(mi_context, mi_shape):
     abs_path = mi_context.resolve_scene_relative_path(filename)
 
     # Load the mesh from the file
-    bl_meshes = bl_import_obj.load(abs_path)
-    # FIXME: Handle multiple objects if supported by Mistuba.
-    if len(bl_meshes) > 1:
-        mi_context.log('OBJ file containing more than one mesh. Only the first one will be loaded.', 'WARN')
-    bl_mesh = bl_meshes[0]
+    # NOTE: Mitsuba loads all the objects of an OBJ file as a single mesh, so we do the same.
+    bl_mesh = bl_import_obj.load(abs_path, single_mesh=True)[0]
     bl_mesh.name = mi_shape.id()
 
     # FIXME: Support UV flipping.
 
-    # Set face normals if requested
-    _set_bl_mesh_shading(bl_mesh, mi_shape.get('face_normals', False))
+    # Set face normals and flip them if requested
+    _set_bl_mesh_shading(bl_mesh, mi_shape.get('face_normals', False), flip_normals=mi_shape.get('flip_normals', False))
 
-    world_matrix = bl_transform_utils.mi_transform_to_bl_transform(mi_shape.get('to_world', None))
+    world_matrix = _mi_to_world_to_bl_world_matrix(mi_context, mi_shape)
 
     end_time = time.time()
     mi_context.log(f'Loaded OBJ mesh "{mi_shape.id()}". Took {end_time-start_time:.2f}s.', 'INFO')
 
-    return bl_mesh, mi_context.mi_space_to_bl_space(world_matrix)
+    return bl_mesh, world_matrix
 
-def mi_sphere_to_bl_shape(mi_context, mi_shape):
-    bl_mesh = bpy.data.meshes.new(mi_shape.id())
+def _get_bl_primitive_mesh(mi_context, name, key, create_bl_mesh):
+    ''' Get a Blender mesh for a primitive shape, building its geometry only once.
+    The first shape of a kind owns the built mesh, subsequent ones receive a copy of it
+    so that they can still be assigned different materials.
+
+    Params
+    ------
+    mi_context : The Mitsuba import context.
+    name : Name of the returned Blender mesh.
+    key : Hashable key identifying the primitive geometry.
+    create_bl_mesh : Function building the primitive mesh from a name on cache miss.
+    '''
+    bl_template = mi_context.get_bl_primitive_mesh(key)
+    if bl_template is None:
+        bl_mesh = create_bl_mesh(name)
+        mi_context.register_bl_primitive_mesh(key, bl_mesh)
+        return bl_mesh
+    bl_mesh = bl_template.copy()
+    bl_mesh.name = name
+    return bl_mesh
+
+# The bmesh operators are resolved once here instead of on every primitive build.
+# NOTE: The 'diameter' parameter of the UV sphere seems to be missnamed as it results in sphere twice as big as expected
+_bl_primitive_builders = {
+    'sphere': (bmesh.ops.create_uvsphere, dict(u_segments=32, v_segments=16, diameter=1.0, calc_uvs=True)),
+    'disk': (bmesh.ops.create_circle, dict(cap_ends=True, cap_tris=True, segments=32, radius=1.0, calc_uvs=True)),
+    'rectangle': (bmesh.ops.create_grid, dict(x_segments=1, y_segments=1, size=1.0, calc_uvs=True)),
+    'cube': (bmesh.ops.create_cube, dict(size=2.0, calc_uvs=True)),
+}
+
+_bl_primitive_buffers = {}
+
+def _bake_bl_primitive_buffers(kind, op_args):
+    ''' Build a primitive shape with bmesh and read it back into flat numpy buffers.
+
+    Params
+    ------
+    kind : The primitive kind, one of the keys of `_bl_primitive_builders`.
+    op_args : Complete arguments of the bmesh operator.
+
+    Returns
+    -------
+    Tuple of (vertex positions, loop vertex indices, polygon loop starts, polygon loop totals, loop UVs)
+    '''
+    bmesh_op, _ = _bl_primitive_builders[kind]
     bl_bmesh = bmesh.new()
+    # NOTE: The bmesh operators only compute UVs if the mesh already has a UV layer
+    bl_bmesh.loops.layers.uv.new()
+    bmesh_op(bl_bmesh, **op_args)
+    bl_bmesh.verts.index_update()
+    uv_layer = bl_bmesh.loops.layers.uv.active
+
+    bl_loops = [bl_loop for bl_face in bl_bmesh.faces for bl_loop in bl_face.loops]
+    # Fill the flat buffers directly instead of going through per-element tuples
+    verts = np.fromiter((c for bl_vert in bl_bmesh.verts for c in bl_vert.co), dtype=np.float32, count=3 * len(bl_bmesh.verts))
+    loop_verts = np.fromiter((bl_loop.vert.index for bl_loop in bl_loops), dtype=np.int32, count=len(bl_loops))
+    loop_totals = np.fromiter((len(bl_face.loops) for bl_face in bl_bmesh.faces), dtype=np.int32, count=len(bl_bmesh.faces))
+    loop_starts = np.zeros_like(loop_totals)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    uvs = np.fromiter((c for bl_loop in bl_loops for c in bl_loop[uv_layer].uv), dtype=np.float32, count=2 * len(bl_loops))
+    bl_bmesh.free()
+
+    return verts, loop_verts, loop_starts, loop_totals, uvs
+
+def _bl_primitive_buffers_key(kind, op_args):
+    _, bmesh_op_args = _bl_primitive_builders[kind]
+    op_args = {**bmesh_op_args, **op_args}
+    return (kind, *sorted(op_args.items())), op_args
+
+def _get_bl_primitive_buffers(kind, **op_args):
+    ''' Get the flat geometry buffers of a primitive shape.
+    The buffers are baked on first use, once per set of arguments, and reused for every mesh of that kind.
+
+    Params
+    ------
+    kind : The primitive kind, one of the keys of `_bl_primitive_builders`.
+    op_args : Arguments overriding the default arguments of the bmesh operator.
+
+    Returns
+    -------
+    Tuple of (vertex positions, loop vertex indices, polygon loop starts, polygon loop totals, loop UVs)
+    '''
+    key, op_args = _bl_primitive_buffers_key(kind, op_args)
+    buffers = _bl_primitive_buffers.get(key)
+    if buffers is None:
+        buffers = _bake_bl_primitive_buffers(kind, op_args)
+        _bl_primitive_buffers[key] = buffers
+    return buffers
+
+def _create_bl_primitive_mesh(name, kind, flat_shading, flip_normals, **op_args):
+    ''' Create a Blender mesh for a primitive shape by writing its geometry buffers directly.
+
+    Params
+    ------
+    name : Name of the new Blender mesh.
+    kind : The primitive kind, one of the keys of `_bl_primitive_builders`.
+    flat_shading : Should the face normals be used instead of the vertex normals?
+    flip_normals : Should the normals be flipped?
+    op_args : Arguments overriding the default arguments of the bmesh operator.
+    '''
+    verts, loop_verts, loop_starts, loop_totals, uvs = _get_bl_primitive_buffers(kind, **op_args)
+
+    if flip_normals:
+        # Reverse the winding of every polygon instead of flipping the normals of the built mesh
+        loop_polygons = np.repeat(np.arange(len(loop_totals)), loop_totals)
+        flipped_loops = 2 * loop_starts[loop_polygons] + loop_totals[loop_polygons] - 1 - np.arange(len(loop_verts))
+        loop_verts = loop_verts[flipped_loops]
+        uvs = uvs.reshape(-1, 2)[flipped_loops].ravel()
+
+    bl_mesh = bpy.data.meshes.new(name)
+    bl_mesh.vertices.add(len(verts) // 3)
+    _foreach_set(bl_mesh.vertices, 'co', verts, np.float32)
+    bl_mesh.loops.add(len(loop_verts))
+    _foreach_set(bl_mesh.loops, 'vertex_index', loop_verts, np.int32)
+    bl_mesh.polygons.add(len(loop_totals))
+    _foreach_set(bl_mesh.polygons, 'loop_start', loop_starts, np.int32)
+    _foreach_set(bl_mesh.polygons, 'loop_total', loop_totals, np.int32)
+    bl_uv_layer = bl_mesh.uv_layers.new()
+    _foreach_set(bl_uv_layer.data, 'uv', uvs, np.float32)
+    _set_bl_mesh_shading(bl_mesh, flat_shading=flat_shading, is_new_mesh=True, update=False)
+
+    # The edges are inferred from the polygons
+    bl_mesh.update(calc_edges=True)
+
+    return bl_mesh
 
+def mi_sphere_to_bl_shape(mi_context, mi_shape):
     if mi_shape.has_property('to_world'):
-        world_matrix = mi_context.mi_space_to_bl_space(bl_transform_utils.mi_transform_to_bl_transform(mi_shape.get('to_world', None)))
-        radius = 1.0
+        world_matrix = _mi_to_world_to_bl_world_matrix(mi_context, mi_shape)
     else:
         # NOTE: We transform only the position vector to Blender space as the mesh is already correctly oriented.
-        world_matrix = Matrix.Translation(mi_context.mi_space_to_bl_space(Vector(mi_shape.get('center', [0.0, 0.0, 0.0]))))
+        #       The radius is encoded in the world matrix so that all spheres can share the same geometry.
         radius = mi_shape.get('radius', 1.0)
+        world_matrix = np.diag([radius, radius, radius, 1.0])
+        world_matrix[:3, 3] = mi_context.mi_space_to_bl_space_np(mi_shape.get('center', (0.0, 0.0, 0.0)))
+        world_matrix = Matrix(world_matrix)
 
-    # Create a UV sphere mesh
-    # NOTE: The 'diameter' parameter seems to be missnamed as it results in sphere twice as big as expected
-    bmesh.ops.create_uvsphere(bl_bmesh, u_segments=32, v_segments=16, diameter=radius, calc_uvs=True)
-    bl_bmesh.to_mesh(bl_mesh)
-    bl_bmesh.free()
-
-    _set_bl_mesh_shading(bl_mesh, flat_shading=False, flip_normals=mi_shape.get('flip_normals', False))
+    flip_normals = mi_shape.get('flip_normals', False)
+    # NOTE: Mitsuba spheres are analytic, the tessellation only affects the Blender mesh.
+    u_segments, v_segments = mi_context.sphere_u_segments, mi_context.sphere_v_segments
+    bl_mesh = _get_bl_primitive_mesh(mi_context, mi_shape.id(), ('sphere', flip_normals, u_segments, v_segments),
+                                     lambda name: _create_bl_primitive_mesh(name, 'sphere', flat_shading=False, flip_normals=flip_normals,
+                                                                            u_segments=u_segments, v_segments=v_segments))
 
     # FIXME: Verify that the world matrix is correct
     return bl_mesh, world_matrix
 
 def mi_disk_to_bl_shape(mi_context, mi_shape):
-    bl_mesh = bpy.data.meshes.new(mi_shape.id())
-    bl_bmesh = bmesh.new()
-
-    # Create a disk
-    bmesh.ops.create_circle(bl_bmesh, cap_ends=True, cap_tris=True, segments=32, radius=1.0, calc_uvs=True)
-    bl_bmesh.to_mesh(bl_mesh)
-    bl_bmesh.free()
-
-    _set_bl_mesh_shading(bl_mesh, flip_normals=mi_shape.get('flip_normals', False))
+    flip_normals = mi_shape.get('flip_normals', False)
+    bl_mesh = _get_bl_primitive_mesh(mi_context, mi_shape.id(), ('disk', flip_normals),
+                                     lambda name: _create_bl_primitive_mesh(name, 'disk', flat_shading=True, flip_normals=flip_normals))
 
     # FIXME: The world matrix seems off
-    world_matrix = bl_transform_utils.mi_transform_to_bl_transform(mi_shape.get('to_world', None))
+    world_matrix = _mi_to_world_to_bl_world_matrix(mi_context, mi_shape)
 
-    return bl_mesh, mi_context.mi_space_to_bl_space(world_matrix)
+    return bl_mesh, world_matrix
 
 def mi_rectangle_to_bl_shape(mi_context, mi_shape):
-    bl_mesh = bpy.data.meshes.new(mi_shape.id())
-    bl_bmesh = bmesh.new()
-
-    # Create a rectangle
-    bmesh.ops.create_grid(bl_bmesh, x_segments=1, y_segments=1, size=1.0, calc_uvs=True)
-    bl_bmesh.to_mesh(bl_mesh)
-    bl_bmesh.free()
-
-    _set_bl_mesh_shading(bl_mesh, flip_normals=mi_shape.get('flip_normals', False))
+    flip_normals = mi_shape.get('flip_normals', False)
+    bl_mesh = _get_bl_primitive_mesh(mi_context, mi_shape.id(), ('rectangle', flip_normals),
+                                     lambda name: _create_bl_primitive_mesh(name, 'rectangle', flat_shading=True, flip_normals=flip_normals))
     
     # FIXME: The world matrix seems off
-    world_matrix = bl_transform_utils.mi_transform_to_bl_transform(mi_shape.get('to_world', None))
+    world_matrix = _mi_to_world_to_bl_world_matrix(mi_context, mi_shape)
 
-    return bl_mesh, mi_context.mi_space_to_bl_space(world_matrix)
+    return bl_mesh, world_matrix
 
 def mi_cube_to_bl_shape(mi_context, mi_shape):
-    bl_mesh = bpy.data.meshes.new(mi_shape.id())
-    bl_bmesh = bmesh.new()
-
-    # Create a cube
-    bmesh.ops.create_cube(bl_bmesh, size=2.0, calc_uvs=True)
-    bl_bmesh.to_mesh(bl_mesh)
-    bl_bmesh.free()
-
-    _set_bl_mesh_shading(bl_mesh, flip_normals=mi_shape.get('flip_normals', False))
+    flip_normals = mi_shape.get('flip_normals', False)
+    bl_mesh = _get_bl_primitive_mesh(mi_context, mi_shape.id(), ('cube', flip_normals),
+                                     lambda name: _create_bl_primitive_mesh(name, 'cube', flat_shading=True, flip_normals=flip_normals))
 
     # FIXME: The world matrix seems off
-    world_matrix = bl_transform_utils.mi_transform_to_bl_transform(mi_shape.get('to_world', None))
+    world_matrix = _mi_to_world_to_bl_world_matrix(mi_context, mi_shape)
 
-    return bl_mesh, mi_context.mi_space_to_bl_space(world_matrix)
+    return bl_mesh, world_matrix
 
-def mi_serialized_to_bl_shape(mi_context, mi_shape):
+def _load_mi_serialized_mesh_data(filename, shape_index):
+    ''' Load the raw vertex and face buffers of a serialized mesh.
+    This does not touch any Blender data and can safely run outside of the main thread.
+
+    Params
+    ------
+    filename : Absolute path to the serialized file.
+    shape_index : Index of the shape in the serialized file.
+    '''
     import mitsuba as mi
     from mitsuba.python import traverse
-    start_time = time.time()
 
     # only safe way is to create a shape using mitsuba
-    assert mi_shape.has_property('filename')
-
-    filename = mi_shape.get('filename')
-    abs_path = mi_context.resolve_scene_relative_path(filename)
-
     # no need to parse the trafo as this is taken care of after the mesh is loaded
     mi_shape_dict = {
-        "type": mi_shape.plugin_name(),
-        "filename": abs_path,
-        "shape_index": mi_shape.get('shape_index')
+        "type": "serialized",
+        "filename": filename,
+        "shape_index": shape_index
     }
 
     mi_shape_inst = mi.load_dict(mi_shape_dict)
     params = traverse(mi_shape_inst)
-    vert_count = params["vertex_count"]
-    face_count = params["face_count"]
-    verts = np.array(params["vertex_positions"])
-    faces = np.array(params["faces"])
+    # NOTE: The Mitsuba buffers are already flat and contiguous, so we can expose them to
+    #       numpy directly instead of copying them element by element.
+    verts = np.ascontiguousarray(params["vertex_positions"].numpy())
+    faces = np.ascontiguousarray(params["faces"].numpy())
+    # Blender only takes the fast buffer copy path if the types match its internal storage
+    assert verts.dtype == np.float32 and faces.dtype == np.uint32
+    # Reinterpret the indices as signed integers as expected by Blender (no copy)
+    faces = faces.view(np.int32)
 
-    bl_mesh = bpy.data.meshes.new(mi_shape.id())
-    
-    # https://docs.blender.org/api/current/bpy.types.Mesh.html#bpy.types.Mesh.from_pydata
-    verts = verts.reshape((vert_count, 3))
-    faces = faces.reshape((face_count, 3))
-    verts_pydata = []
-    for i in range(vert_count):
-        verts_pydata.append(tuple(verts[i]))
-    face_pydata = []
-    for i in range(face_count):
-        face_pydata.append(tuple(faces[i]))
-
-    # When an empty iterable is passed in, the edges are inferred from the polygons
-    edges = []
-    bl_mesh.from_pydata(verts_pydata, edges, face_pydata)
-    bl_mesh.calc_normals()
+    return verts, faces
+
+def _assemble_bl_mesh(name, verts, faces, flip_normals=False):
+    ''' Create a Blender triangle mesh from flat vertex and face buffers.
+    This must run on Blender's main thread.
+
+    Params
+    ------
+    name : Name of the new Blender mesh.
+    verts : Flat float32 array of vertex positions.
+    faces : Flat int32 array of triangle vertex indices.
+    flip_normals : boolean, optional
+        Should the winding of the triangles be reversed?
+    '''
+    vert_count = len(verts) // 3
+    face_count = len(faces) // 3
+
+    if flip_normals:
+        faces = faces.reshape(-1, 3)[:, ::-1].ravel()
+
+    bl_mesh = bpy.data.meshes.new(name)
+
+    # NOTE: Writing the raw buffers with `foreach_set` is much faster than `from_pydata`
+    #       as it avoids building a Python object for every vertex and face.
+    bl_mesh.vertices.add(vert_count)
+    _foreach_set(bl_mesh.vertices, 'co', verts, np.float32)
+    bl_mesh.loops.add(face_count * 3)
+    _foreach_set(bl_mesh.loops, 'vertex_index', faces, np.int32)
+    bl_mesh.polygons.add(face_count)
+    # Store the polygon loop starts and totals back to back in a single allocation
+    polygon_loops = np.empty(2 * face_count, dtype=np.int32)
+    np.multiply(np.arange(face_count, dtype=np.int32), 3, out=polygon_loops[:face_count])
+    polygon_loops[face_count:] = 3
+    _foreach_set(bl_mesh.polygons, 'loop_start', polygon_loops[:face_count], np.int32)
+    _foreach_set(bl_mesh.polygons, 'loop_total', polygon_loops[face_count:], np.int32)
+
+    # The edges are inferred from the polygons
+    bl_mesh.update(calc_edges=True)
+
+    return bl_mesh
+
+def _mi_serialized_load_args(mi_context, mi_shape):
+    assert mi_shape.has_property('filename')
+
+    filename = mi_shape.get('filename')
+    abs_path = mi_context.resolve_scene_relative_path(filename)
+    return abs_path, mi_shape.get('shape_index', 0)
+
+def mi_serialized_to_bl_shape(mi_context, mi_shape):
+    start_time = time.time()
+
+    prefetcher = mi_context.mi_shape_data_prefetcher
+    future = prefetcher.pop(mi_shape.id()) if prefetcher is not None else None
+    if future is not None:
+        # The mesh data was prefetched by a worker thread
+        verts, faces = future.result()
+    else:
+        verts, faces = _load_mi_serialized_mesh_data(*_mi_serialized_load_args(mi_context, mi_shape))
+
+    bl_mesh = _assemble_bl_mesh(mi_shape.id(), verts, faces, flip_normals=mi_shape.get('flip_normals', False))
     
     end_time = time.time()
     mi_context.log(f'Loaded serialized mesh "{mi_shape.id()}". Took {end_time-start_time:.2f}s.', 'INFO')
@@ -227,13 +425,81 @@ _shape_converters = {
     "serialized": mi_serialized_to_bl_shape
 }
 
+_shape_data_loaders = {
+    'serialized': (_mi_serialized_load_args, _load_mi_serialized_mesh_data),
+}
+
+class MitsubaShapeDataPrefetcher:
+    ''' Load the raw mesh data of shapes on worker threads ahead of their conversion.
+    At most `max_pending` loading jobs are in flight at any time so that the peak memory
+    stays bounded, new jobs are submitted as the converters consume the results.
+    '''
+    def __init__(self, executor, thread_env, variant, max_pending):
+        self.executor = executor
+        self.thread_env = thread_env
+        self.variant = variant
+        self.max_pending = max_pending
+        self.queued = OrderedDict()
+        self.futures = {}
+
+    def _load(self, load_data, args):
+        from mitsuba import set_variant, ScopedSetThreadEnvironment
+        # Use the variant of the main thread at the time of the import
+        set_variant(self.variant)
+        # Share the Mitsuba logger and file resolver of the main thread
+        with ScopedSetThreadEnvironment(self.thread_env):
+            return load_data(*args)
+
+    def _submit_queued(self):
+        while self.queued and len(self.futures) < self.max_pending:
+            id, (load_data, args) = self.queued.popitem(last=False)
+            self.futures[id] = self.executor.submit(self._load, load_data, args)
+
+    def add(self, id, load_data, args):
+        self.queued[id] = (load_data, args)
+        self._submit_queued()
+
+    def pop(self, id):
+        ''' Get the future of a shape's loading job, or None if it was not submitted '''
+        future = self.futures.pop(id, None)
+        if future is None:
+            # The shape is converted before its turn, let the converter load it directly
+            self.queued.pop(id, None)
+        self._submit_queued()
+        return future
+
+    def shutdown(self):
+        ''' Cancel the jobs that were not consumed by a converter '''
+        self.queued.clear()
+        self.futures.clear()
+        self.executor.shutdown(cancel_futures=True)
+
+def prefetch_mi_shape_data(mi_context, prefetcher):
+    ''' Queue the loading of the raw mesh data of every supported shape in the scene.
+    The file I/O and decoding run on the prefetcher's worker threads while the
+    Blender meshes are later assembled on the main thread by the converters.
+
+    Params
+    ------
+    mi_context : The Mitsuba import context.
+    prefetcher : The `MitsubaShapeDataPrefetcher` to queue the loading jobs to.
+    '''
+    for cls, mi_props in mi_context.mi_scene_props:
+        if cls != 'Shape':
+            continue
+        loader = _shape_data_loaders.get(mi_props.plugin_name())
+        if loader is None:
+            continue
+        get_args, load_data = loader
+        # NOTE: The properties are read on the main thread, only the loading is deferred.
+        prefetcher.add(mi_props.id(), load_data, get_args(mi_context, mi_props))
+
 def mi_shape_to_bl_shape(mi_context, mi_shape):
     shape_type = mi_shape.plugin_name()
-    if shape_type not in _shape_converters:
+    converter = _shape_converters.get(shape_type)
+    if converter is None:
         mi_context.log(f'Mitsuba Shape type "{shape_type}" not supported.', 'ERROR')
         return None
-    
-    # Create the Blender object
-    bl_mesh, world_matrix = _shape_converters[shape_type](mi_context, mi_shape)
 
-    return bl_mesh, world_matrix
+    # Create the Blender object
+    return converter(mi_context, mi_shape)
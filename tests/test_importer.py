@@ -226,4 +226,170 @@ def test_importer_hdrfilm_film(resource_resolver, mitsuba_scene_parser, xml_scen
     else:
         assert bl_render.use_border == False
 
-    # assert len(mi_film.unqueried()) == 0
\ No newline at end of file
+    # assert len(mi_film.unqueried()) == 0
+
+def _expected_primitive_counts(kind):
+    ''' Expected (vertex, polygon, loop) counts of the meshes created for primitive shapes '''
+    if kind == 'sphere':
+        # The tessellation is set by the import options
+        import_props = bpy.ops.import_scene.mitsuba.get_rna_type().properties
+        u = import_props['sphere_u_segments'].default
+        v = import_props['sphere_v_segments'].default
+        # Triangle fans at both poles and quads in between
+        return u * (v - 1) + 2, u * v, 2 * u * 3 + u * (v - 2) * 4
+    elif kind == 'disk':
+        # Triangle fan of 32 segments around the center
+        return 32 + 1, 32, 32 * 3
+    elif kind == 'rectangle':
+        return 4, 1, 4
+    elif kind == 'cube':
+        return 8, 6, 24
+
+@pytest.mark.parametrize("xml_scene", ["scenes/shape_primitives.xml"])
+@pytest.mark.parametrize("kind", ["sphere", "disk", "rectangle", "cube"])
+def test_importer_primitive_shapes(resource_resolver, xml_scene, kind):
+    scene_file = resource_resolver.get_absolute_resource_path(xml_scene)
+
+    assert bpy.ops.import_scene.mitsuba(filepath=scene_file) == {'FINISHED'}
+
+    vert_count, polygon_count, loop_count = _expected_primitive_counts(kind)
+    bl_mesh = bpy.context.scene.objects[kind].data
+    bl_mesh_flipped = bpy.context.scene.objects[f'{kind}_flipped'].data
+    assert bl_mesh != bl_mesh_flipped
+    for mesh in (bl_mesh, bl_mesh_flipped):
+        assert len(mesh.vertices) == vert_count
+        assert len(mesh.polygons) == polygon_count
+        assert len(mesh.loops) == loop_count
+        assert len(mesh.uv_layers) == 1
+        assert len(mesh.uv_layers[0].data) == loop_count
+
+    # Flipping the normals reverses the winding of every polygon
+    for polygon, polygon_flipped in zip(bl_mesh.polygons, bl_mesh_flipped.polygons):
+        assert polygon.normal.dot(polygon_flipped.normal) == pytest.approx(-1.0, abs=1e-5)
+    # The normals of closed primitives point outwards unless flipped
+    if kind in ('sphere', 'cube'):
+        assert all(polygon.center.dot(polygon.normal) > 0.0 for polygon in bl_mesh.polygons)
+        assert all(polygon.center.dot(polygon.normal) < 0.0 for polygon in bl_mesh_flipped.polygons)
+
+@pytest.mark.parametrize("xml_scene", ["scenes/shape_obj_multiple_objects.xml"])
+def test_importer_obj_multiple_objects(resource_resolver, xml_scene):
+    scene_file = resource_resolver.get_absolute_resource_path(xml_scene)
+
+    mesh_names_before = set(bpy.data.meshes.keys())
+
+    assert bpy.ops.import_scene.mitsuba(filepath=scene_file) == {'FINISHED'}
+
+    # All the objects of the file are merged into a single mesh, without leaving orphan meshes
+    new_meshes = [mesh for mesh in bpy.data.meshes if mesh.name not in mesh_names_before]
+    assert len(new_meshes) == 1
+    bl_mesh = new_meshes[0]
+    assert bl_mesh.users > 0
+    assert bpy.context.scene.objects['two_objects'].data == bl_mesh
+    assert len(bl_mesh.vertices) == 7
+    assert len(bl_mesh.polygons) == 2
+    assert sorted(len(polygon.vertices) for polygon in bl_mesh.polygons) == [3, 4]
+
+@pytest.mark.parametrize("xml_scene", ["scenes/shape_primitives_shared.xml"])
+def test_importer_primitive_shapes_shared_geometry(resource_resolver, xml_scene):
+    scene_file = resource_resolver.get_absolute_resource_path(xml_scene)
+
+    assert bpy.ops.import_scene.mitsuba(filepath=scene_file) == {'FINISHED'}
+
+    bl_mesh_red = bpy.context.scene.objects['cube_red'].data
+    bl_mesh_blue = bpy.context.scene.objects['cube_blue'].data
+    # Primitives of the same kind share their geometry but not their mesh
+    assert bl_mesh_red != bl_mesh_blue
+    assert len(bl_mesh_red.vertices) == len(bl_mesh_blue.vertices)
+    for vertex_red, vertex_blue in zip(bl_mesh_red.vertices, bl_mesh_blue.vertices):
+        assert vertex_red.co == vertex_blue.co
+    assert [tuple(p.vertices) for p in bl_mesh_red.polygons] == [tuple(p.vertices) for p in bl_mesh_blue.polygons]
+    # Each mesh keeps its own material
+    assert len(bl_mesh_red.materials) == 1
+    assert len(bl_mesh_blue.materials) == 1
+    assert bl_mesh_red.materials[0] != bl_mesh_blue.materials[0]
+
+@pytest.mark.parametrize("xml_scene", ["scenes/shape_sphere_center_radius.xml"])
+def test_importer_sphere_center_radius(resource_resolver, mitsuba_scene_parser, xml_scene):
+    from mathutils import Matrix, Vector
+    from bpy_extras.io_utils import axis_conversion
+
+    scene_file = resource_resolver.get_absolute_resource_path(xml_scene)
+    mitsuba_scene_parser.load_xml(scene_file)
+
+    mi_sphere = mitsuba_scene_parser.get_props_by_name('sphere')
+    assert mi_sphere
+
+    # Use a non trivial axis conversion so that the center has to be transformed
+    assert bpy.ops.import_scene.mitsuba(filepath=scene_file, axis_forward='-Z', axis_up='Y') == {'FINISHED'}
+
+    axis_mat_inv = axis_conversion(to_forward='-Z', to_up='Y').to_4x4().inverted()
+    center = axis_mat_inv @ Vector(mi_sphere.get('center'))
+    expected_matrix = Matrix.Translation(center) @ Matrix.Scale(mi_sphere.get('radius'), 4)
+
+    bl_matrix = bpy.context.scene.objects['sphere'].matrix_world
+    for bl_row, expected_row in zip(bl_matrix, expected_matrix):
+        assert tuple(bl_row) == pytest.approx(tuple(expected_row), abs=1e-5)
+
+@pytest.mark.parametrize("xml_scene", ["scenes/shape_serialized.xml"])
+def test_importer_serialized_shapes(resource_resolver, xml_scene):
+    scene_file = resource_resolver.get_absolute_resource_path(xml_scene)
+
+    assert bpy.ops.import_scene.mitsuba(filepath=scene_file) == {'FINISHED'}
+
+    # Triangles.serialized holds a triangle (shape 0) and a quad made of two triangles (shape 1)
+    for name, vert_count, polygon_count in (('triangle', 3, 1), ('quad', 4, 2), ('quad_flipped', 4, 2)):
+        bl_mesh = bpy.context.scene.objects[name].data
+        assert len(bl_mesh.vertices) == vert_count
+        assert len(bl_mesh.polygons) == polygon_count
+        assert len(bl_mesh.loops) == 3 * polygon_count
+        assert all(polygon.loop_total == 3 for polygon in bl_mesh.polygons)
+
+    # Flipping the normals reverses the winding of every polygon
+    bl_mesh = bpy.context.scene.objects['quad'].data
+    bl_mesh_flipped = bpy.context.scene.objects['quad_flipped'].data
+    for polygon, polygon_flipped in zip(bl_mesh.polygons, bl_mesh_flipped.polygons):
+        assert polygon.normal.dot(polygon_flipped.normal) == pytest.approx(-1.0, abs=1e-5)
+
+@pytest.mark.parametrize("xml_scene", ["scenes/shape_serialized_many.xml"])
+def test_importer_serialized_shapes_prefetched(resource_resolver, xml_scene):
+    scene_file = resource_resolver.get_absolute_resource_path(xml_scene)
+
+    assert bpy.ops.import_scene.mitsuba(filepath=scene_file) == {'FINISHED'}
+
+    # The shapes alternate between the triangle and the quad, so crossed or dropped
+    # prefetched data would show up as wrong counts
+    bl_meshes = [bpy.context.scene.objects[f'mesh_{i}'].data for i in range(8)]
+    assert len(set(bl_meshes)) == len(bl_meshes)
+    for i, bl_mesh in enumerate(bl_meshes):
+        vert_count, polygon_count = (3, 1) if i % 2 == 0 else (4, 2)
+        assert len(bl_mesh.vertices) == vert_count
+        assert len(bl_mesh.polygons) == polygon_count
+
+def test_shape_data_prefetcher():
+    import importlib
+    from concurrent.futures import ThreadPoolExecutor
+    from mitsuba import ThreadEnvironment, variant
+    shapes = importlib.import_module("mitsuba-blender.io.importer.shapes")
+    assert shapes
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    prefetcher = shapes.MitsubaShapeDataPrefetcher(executor, ThreadEnvironment(), variant(), max_pending=1)
+    for id in ('a', 'b', 'c'):
+        prefetcher.add(id, lambda id: id.upper(), (id,))
+    # Only the first job is submitted, the others wait for a free slot
+    assert list(prefetcher.futures) == ['a']
+    assert list(prefetcher.queued) == ['b', 'c']
+
+    # A shape converted before its turn is dropped from the queue and loaded by the converter
+    assert prefetcher.pop('c') is None
+    assert list(prefetcher.queued) == ['b']
+
+    # Consuming a job submits the next queued one
+    assert prefetcher.pop('a').result() == 'A'
+    assert list(prefetcher.futures) == ['b']
+    assert not prefetcher.queued
+
+    # Unconsumed jobs are cancelled or discarded
+    prefetcher.shutdown()
+    assert not prefetcher.futures
+    assert not prefetcher.queued
\ No newline at end of file